@@ -23,29 +23,58 @@ RAG collections (text-rich, generative-ready):
  10. PodcastSearch    – iTunes popular-podcasts dataset
 
 Usage:
-    python3 populate.py [--skip-github] [--verify-only] [--rag-only] [--legacy-only]
+    python3 populate.py [--skip-github] [--verify-only] [--rag-only | --legacy-only]
+                        [--no-embed] [--refresh-cache] [--parallel] [--quiet]
+                        [--keep-existing]
 
 Options:
     --skip-github   Skip GitHub data fetching (faster, no API calls)
     --verify-only   Only verify existing collections, don't populate
     --rag-only      Only create the RAG collections (Books, PodcastSearch)
     --legacy-only   Only create the legacy collections (Jeopardy, Author, etc.)
+    --no-embed      Create collections without a vectorizer (fast import, no vector search)
+    --refresh-cache Re-download cached datasets instead of reading them from disk
+    --parallel      Populate every collection family in its own process
+    --quiet         Only print warnings and errors
+    --keep-existing Reuse existing collections instead of dropping and recreating them
+                    (data is re-imported as upserts, except GitHub users that
+                    already exist; their schema is not changed)
 """
 
 import weaviate
 import weaviate.classes as wvc
-from weaviate.classes.config import Configure, Property, DataType
+from weaviate.classes.config import Configure, Property, DataType, ReferenceProperty
+from weaviate.util import generate_uuid5
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
+import hashlib
 import csv
+import email.utils
 import io
 import time
 import os
+import socket
 import sys
+import threading
 import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from datetime import datetime
+from pathlib import Path
 import random
 
+try:
+    import orjson  # optional – faster JSON decoding when installed
+except ImportError:
+    orjson = None
+
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+log = logging.getLogger("populate")
+
 # ──────────────────────────────────────────────────────────────
 # Constants – tweak these to change how much data is imported.
 # ──────────────────────────────────────────────────────────────
@@ -53,45 +82,179 @@ import random
 BOOKS_LIMIT = 0
 PODCASTS_LIMIT = 0
 
+# Set to False (or pass --no-embed) to create every collection with no
+# vectorizer. Imports then skip transformer inference entirely, at the
+# cost of semantic / hybrid search on the sandbox data.
+VECTORIZE = True
+
+# Set to True (or pass --keep-existing) to reuse collections that already
+# exist instead of dropping and recreating them. The data is still re-imported:
+# every object gets a deterministic generate_uuid5() id, so the batch writes
+# upsert rows in place instead of duplicating them. The exception is GitHub:
+# users already in GitHubUser are skipped with their repos and issues, so a
+# repo or issue fetch that failed on an earlier run is never back-filled. A kept
+# collection keeps its schema – a different vectorizer (e.g. under --no-embed)
+# is only warned about.
+KEEP_EXISTING = False
+
 BOOKS_CSV_URL = (
     "https://raw.githubusercontent.com/zygmuntz/goodbooks-10k/master/books.csv"
 )
 PODCASTS_CSV_URL = (
     "https://raw.githubusercontent.com/odenizgiz/Podcasts-Data/master/df_popular_podcasts.csv"
 )
+JEOPARDY_JSON_URL = (
+    "https://raw.githubusercontent.com/weaviate-tutorials/edu-datasets/main/jeopardy_100.json"
+)
+
+# Static datasets are downloaded once and re-read from here on later runs.
+# Pass --refresh-cache to download them again.
+CACHE_DIR = Path.home() / ".cache" / "weaviate-studio"
+REFRESH_CACHE = False
+# GitHub API responses are cached with their ETag. Within GITHUB_CACHE_TTL
+# seconds they are reused as-is; after that they are revalidated.
+GITHUB_CACHE_DIR = CACHE_DIR / "github"
+GITHUB_CACHE_TTL = 3600
+
+# Objects sent per batch request and how many batch requests may be in flight.
+BATCH_SIZE = 200
+BATCH_CONCURRENT_REQUESTS = 2
 
 WEAVIATE_HOST = "localhost"
 WEAVIATE_PORT = 8080
+WEAVIATE_GRPC_PORT = 50051
 WEAVIATE_API_KEY = "test-key-123"
-
-# Force HTTP-only mode
-os.environ["WEAVIATE_GRPC_ENABLED"] = "false"
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_USERS = ["torvalds", "gaearon", "sindresorhus", "tj", "addyosmani"]
+# Concurrent GitHub API requests while fetching users and repositories.
+GITHUB_FETCH_WORKERS = 8
+# Optional – a token raises the GitHub API limit from 60 to 5,000 requests/hour.
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN", "")
+# Pause until the rate-limit window resets once fewer requests than this remain,
+# unless the reset is further away than GITHUB_MAX_RATE_LIMIT_WAIT seconds.
+GITHUB_RATE_LIMIT_FLOOR = 10
+GITHUB_MAX_RATE_LIMIT_WAIT = 60
+# Rate-limited (403/429) GitHub requests are retried this many times in total;
+# after this many consecutive failed requests the rest of the run skips GitHub.
+GITHUB_MAX_ATTEMPTS = 3
+GITHUB_CIRCUIT_BREAKER_THRESHOLD = 3
+
+# Seconds to keep retrying the readiness probe before giving up.
+READY_TIMEOUT = 20
 
 
 # ──────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────
+def create_http_session(retry_statuses: bool = True) -> requests.Session:
+    """Return a pooled keep-alive session that retries connection errors
+    (and, with *retry_statuses*, 429/502/503/504 responses, honouring Retry-After)."""
+    if retry_statuses:
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 502, 503, 504),
+            raise_on_status=False,
+        )
+    else:
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status=0,
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=max(20, GITHUB_FETCH_WORKERS),
+        max_retries=retry,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+# Shared by every dataset download so TCP/TLS connections are reused instead
+# of re-established per request.
+SESSION = create_http_session()
+# GitHub API calls get their own session without status retries: github_get()
+# alone decides how often and how long a rate-limited request is retried.
+GITHUB_SESSION = create_http_session(retry_statuses=False)
+
+AGGREGATE_COUNT_ROOT = "{alias}: {name} {{ meta {{ count }} }}"
+
+GITHUB_HEADERS = {"Accept": "application/vnd.github+json"}
+if GITHUB_TOKEN:
+    GITHUB_HEADERS["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+
+
 def download_csv(url: str, label: str) -> list[dict]:
-    """Download a CSV from *url* and return a list of row-dicts."""
-    print(f"⬇  Downloading {label} from {url} …")
+    """Download a CSV from *url* (or the local cache) and return a list of row-dicts."""
+    log.info("⬇  Loading %s from %s …", label, url)
     try:
-        resp = requests.get(url, timeout=60)
-        resp.raise_for_status()
+        content = fetch_cached(url, url.rsplit("/", 1)[-1], timeout=60)
     except Exception as exc:
-        print(f"✗  Failed to download {label}: {exc}")
+        log.error("✗  Failed to download %s: %s", label, exc)
         return []
 
     try:
-        text = resp.content.decode("utf-8")
+        text = content.decode("utf-8")
     except UnicodeDecodeError:
-        text = resp.content.decode("latin-1")
+        text = content.decode("latin-1")
 
     reader = csv.DictReader(io.StringIO(text))
     rows = [row for row in reader]
-    print(f"✓  Downloaded {len(rows)} rows for {label}")
+    log.info("✓  Loaded %s rows for %s", len(rows), label)
     return rows
 
 
+def fetch_cached(url: str, filename: str, timeout: int = 10) -> bytes:
+    """Return the body of *url*, served from CACHE_DIR after the first download.
+    The download is streamed to a temporary file and renamed, so no partial file is cached."""
+    path = CACHE_DIR / filename
+    if path.exists() and not REFRESH_CACHE:
+        return path.read_bytes()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with SESSION.get(url, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        with open(tmp_path, "wb") as fh:
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                fh.write(chunk)
+    tmp_path.replace(path)
+    return path.read_bytes()
+
+
+def load_json(raw: bytes):
+    """Decode a JSON payload, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def row_mapper(keymap: tuple):
+    """Return a function mapping a row to properties via ``(property, source_key, default)`` triples.
+
+    *default* replaces missing and null values only; falsy values are kept.
+    """
+    def build(row: dict) -> dict:
+        return {
+            prop: default if (value := row.get(key)) is None else value
+            for prop, key, default in keymap
+        }
+    return build
+
+
+def truncate_utf8(text, limit: int) -> str:
+    """Trim *text* (None counts as empty) to at most *limit* UTF-8 bytes, stripped."""
+    if not text:
+        return ""
+    return text.encode("utf-8")[:limit].decode("utf-8", "ignore").strip()
+
+
 def safe_int(value, default=0):
     if not value:
         return default
@@ -110,263 +273,357 @@ def safe_float(value, default=0.0):
         return default
 
 
+def report_failures(label: str, errors, limit: int = 5) -> None:
+    """Print the first *limit* batch errors for *label* and a summary count."""
+    errors = list(errors)
+    for error in errors[:limit]:
+        log.warning("   ⚠  Failed to insert %s: %s", label, error.message)
+    if len(errors) > limit:
+        log.warning("   ⚠  … and %s more %s failures", len(errors) - limit, label)
+
+
+def client_batch_insert(client, label: str, items) -> int:
+    """Write ``(collection_name, DataObject)`` pairs in one client-level batch.
+    Returns the number of objects inserted without error."""
+    queued = 0
+    with client.batch.fixed_size(
+        batch_size=BATCH_SIZE, concurrent_requests=BATCH_CONCURRENT_REQUESTS
+    ) as batch:
+        for collection_name, obj in items:
+            batch.add_object(
+                collection=collection_name,
+                properties=obj.properties,
+                uuid=obj.uuid,
+                references=obj.references,
+            )
+            queued += 1
+
+    failed = client.batch.failed_objects
+    report_failures(label, failed)
+    return queued - len(failed)
+
+
+def batch_insert(collection, label: str, objects) -> int:
+    """Stream ``DataObject``s into *collection* in fixed-size batches.
+    Returns the number of objects inserted without error."""
+    queued = 0
+    with collection.batch.fixed_size(
+        batch_size=BATCH_SIZE, concurrent_requests=BATCH_CONCURRENT_REQUESTS
+    ) as batch:
+        for obj in objects:
+            batch.add_object(properties=obj.properties, uuid=obj.uuid, references=obj.references)
+            queued += 1
+            if queued % 1000 == 0:
+                log.info("   Queued %s %s …", queued, label)
+
+    failed = collection.batch.failed_objects
+    report_failures(label, failed)
+    return queued - len(failed)
+
+
+def batch_import(collection, label: str, objects, key) -> int:
+    """Batch-import property dicts into *collection* with ``generate_uuid5(key(properties))`` ids."""
+    return batch_insert(collection, label, (
+        wvc.data.DataObject(properties=properties, uuid=generate_uuid5(key(properties)))
+        for properties in objects
+    ))
+
+
+def drop_collections(client, names) -> None:
+    """Delete every collection in *names* concurrently (nothing under --keep-existing)."""
+    if KEEP_EXISTING:
+        return
+
+    def drop(name):
+        try:
+            client.collections.delete(name)
+        except Exception as e:
+            log.info("Note: Could not delete existing %s collection: %s", name, e)
+
+    with ThreadPoolExecutor(max_workers=len(names)) as pool:
+        list(pool.map(drop, names))
+
+
+class SchemaError(RuntimeError):
+    """A collection could not be created; nothing after it should be imported."""
+
+
+def vectorizer_name(vectorizer) -> str:
+    """Return the module name of a vectorizer enum or string (``"none"`` for None)."""
+    if vectorizer is None:
+        return "none"
+    return str(getattr(vectorizer, "value", vectorizer))
+
+
+def create_collection(client, name: str, **config):
+    """Create collection *name* from *config*, or keep an existing one under --keep-existing.
+    Raises SchemaError if Weaviate cannot be reached or rejects the definition."""
+    if not VECTORIZE:
+        config["vectorizer_config"] = Configure.Vectorizer.none()
+    try:
+        if KEEP_EXISTING and client.collections.exists(name):
+            collection = client.collections.get(name)
+            requested = config.get("vectorizer_config")
+            if requested is not None:
+                existing = vectorizer_name(collection.config.get().vectorizer)
+                wanted = vectorizer_name(requested.vectorizer)
+                if existing != wanted:
+                    log.warning("⚠ %s keeps its %s vectorizer (this run asked for %s)", name, existing, wanted)
+            log.info("• %s already exists – keeping it (--keep-existing)", name)
+            return collection
+        collection = client.collections.create(name=name, **config)
+    except Exception as e:
+        raise SchemaError(f"Failed to set up {name} collection: {e}") from e
+    log.info("✓ %s collection created successfully!", name)
+    return collection
+
+
+def create_collections(client, schemas: dict, tiers):
+    """Create the collections in *schemas* tier by tier, each tier concurrently.
+    Returns a name → collection mapping; a SchemaError stops before the next tier."""
+    collections = {}
+    with ThreadPoolExecutor(max_workers=max(len(tier) for tier in tiers)) as pool:
+        for tier in tiers:
+            futures = {
+                name: pool.submit(create_collection, client, name, **schemas[name])
+                for name in tier
+            }
+            for name, future in futures.items():
+                collections[name] = future.result()
+    return collections
+
+
+def recreate_collection(client, name: str, **config):
+    """Drop collection *name* and create it again from *config*."""
+    drop_collections(client, [name])
+    return create_collection(client, name, **config)
+
+
+def wait_for_port(host: str, port: int, timeout: float) -> bool:
+    """Return True once a TCP connection to *host*:*port* succeeds, False after *timeout* s."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return True
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+
+
 def connect_to_weaviate():
     """Connect to Weaviate with error handling"""
+    # One deadline covers the port wait, the readiness probe and the gRPC check.
+    deadline = time.monotonic() + READY_TIMEOUT
+    # A bare TCP connect tells us the listener is bound before any HTTP is spoken.
+    if not wait_for_port(WEAVIATE_HOST, WEAVIATE_PORT, deadline - time.monotonic()):
+        log.error("✗ Nothing is listening on %s:%s after %s seconds", WEAVIATE_HOST, WEAVIATE_PORT, READY_TIMEOUT)
+        log.error("Make sure Weaviate is running with: docker compose up -d")
+        return None
+
     try:
         client = weaviate.connect_to_local(
             host=WEAVIATE_HOST,
             port=WEAVIATE_PORT,
+            grpc_port=WEAVIATE_GRPC_PORT,
             auth_credentials=weaviate.auth.AuthApiKey(WEAVIATE_API_KEY),
             skip_init_checks=True,
             additional_config=weaviate.config.AdditionalConfig(
-                timeout=weaviate.config.Timeout(init=30, query=60, insert=120)
+                timeout=weaviate.config.Timeout(init=30, query=60, insert=300)
             )
         )
-        print("✓ Connected to Weaviate successfully")
-
-        print("Checking if Weaviate is ready...")
-        for attempt in range(10):
-            try:
-                client.collections.list_all()
-                print("✓ Weaviate is ready")
-                return client
-            except Exception:
-                print(f"Waiting for Weaviate to be ready... (attempt {attempt + 1}/10)")
-                time.sleep(2)
-
-        print("✗ Weaviate is not ready after 20 seconds")
-        return None
-
     except Exception as e:
-        print(f"✗ Failed to connect to Weaviate: {e}")
-        print("Make sure Weaviate is running with: docker compose up -d")
+        log.error("✗ Failed to connect to Weaviate: %s", e)
+        log.error("Make sure Weaviate is running with: docker compose up -d")
+        return None
+    log.info("✓ Connected to Weaviate successfully")
+
+    # From here on the client exists, so every failure path must close it.
+    log.info("Checking if Weaviate is ready...")
+    delay = 0.05
+    while True:
+        # is_ready() hits /v1/.well-known/ready, which is cheap no matter
+        # how many collections already exist.
+        if client.is_ready():
+            log.info("✓ Weaviate is ready")
+            break
+        if time.monotonic() >= deadline:
+            log.error("✗ Weaviate is not ready after %s seconds", READY_TIMEOUT)
+            client.close()
+            return None
+        log.info("Waiting for Weaviate to be ready... (retrying in %.2fs)", delay)
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay = min(delay * 2, 1.0)
+
+    # Batch imports and queries go over gRPC and the v4 client has no REST
+    # fallback for them, so an unpublished gRPC port is a setup error.
+    if not wait_for_port(WEAVIATE_HOST, WEAVIATE_GRPC_PORT, timeout=deadline - time.monotonic()):
+        log.error("✗ Weaviate gRPC port %s:%s is not reachable", WEAVIATE_HOST, WEAVIATE_GRPC_PORT)
+        log.error("Make sure docker-compose.yml publishes it (\"50051:50051\")")
+        client.close()
         return None
+    return client
 
 
 # ══════════════════════════════════════════════════════════════
 # LEGACY COLLECTIONS (nested properties & cross-references)
 # ══════════════════════════════════════════════════════════════
 
+JEOPARDY_KEYMAP = (
+    ("question", "Question", ""),
+    ("answer", "Answer", ""),
+    ("value", "Value", 0),
+    ("round", "Round", ""),
+)
+map_jeopardy_row = row_mapper(JEOPARDY_KEYMAP)
+
 def create_jeopardy_collection(client):
     """Create and populate JeopardyQuestion collection"""
-    print("\n=== Creating JeopardyQuestion collection ===")
+    log.info("\n=== Creating JeopardyQuestion collection ===")
 
-    try:
-        if client.collections.exists("JeopardyQuestion"):
-            client.collections.delete("JeopardyQuestion")
-            print("✓ Deleted existing JeopardyQuestion collection")
-    except Exception as e:
-        print(f"Note: Could not delete existing JeopardyQuestion collection: {e}")
+    collection = recreate_collection(
+        client,
+        "JeopardyQuestion",
+        vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
+        generative_config=Configure.Generative.openai(),
+        properties=[
+            Property(name="question", data_type=DataType.TEXT),
+            Property(name="answer", data_type=DataType.TEXT),
+            Property(name="round", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="value", data_type=DataType.INT),
+        ]
+    )
 
     try:
-        collection = client.collections.create(
-            name="JeopardyQuestion",
-            vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
-            generative_config=Configure.Generative.openai(),
-            properties=[
-                Property(name="question", data_type=DataType.TEXT),
-                Property(name="answer", data_type=DataType.TEXT),
-                Property(name="round", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(name="value", data_type=DataType.INT),
-            ]
+        log.info("Loading Jeopardy sample data...")
+        data = load_json(fetch_cached(JEOPARDY_JSON_URL, "jeopardy_100.json"))
+        log.info("✓ Loaded %s sample questions", len(data))
+
+        log.info("Starting Jeopardy data import...")
+        success_count = batch_import(
+            collection,
+            "Jeopardy question",
+            map(map_jeopardy_row, data),
+            key=lambda properties: f'{properties["question"]}|{properties["answer"]}',
         )
-        print("✓ JeopardyQuestion collection created successfully!")
-
-        print("Downloading Jeopardy sample data...")
-        url = 'https://raw.githubusercontent.com/weaviate-tutorials/edu-datasets/main/jeopardy_100.json'
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        data = json.loads(resp.text)
-        print(f"✓ Downloaded {len(data)} sample questions")
 
-        print("Starting Jeopardy data import...")
-        success_count = 0
-
-        for i, row in enumerate(data):
-            try:
-                question_object = {
-                    "question": row["Question"],
-                    "answer": row["Answer"],
-                    "value": row.get("Value", 0) if row.get("Value") else 0,
-                    "round": row["Round"],
-                }
-                collection.data.insert(question_object)
-                success_count += 1
-                if (i + 1) % 10 == 0:
-                    print(f"Imported {i + 1} Jeopardy questions...")
-            except Exception as e:
-                print(f"Failed to insert Jeopardy question {i + 1}: {e}")
-
-        print(f"✓ Successfully imported {success_count} out of {len(data)} Jeopardy questions")
+        log.info("✓ Successfully imported %s out of %s Jeopardy questions", success_count, len(data))
         return True
 
     except Exception as e:
-        print(f"✗ Failed to create JeopardyQuestion collection: {e}")
-        return False
-
-
-def create_book_collections(client):
-    """Create and populate Author, Publisher, Book, and Review collections"""
-    print("\n=== Creating Book Domain Collections ===")
-
-    # Collection 1: Author
-    print("Creating Author collection...")
-    try:
-        if client.collections.exists("Author"):
-            client.collections.delete("Author")
-            print("✓ Deleted existing Author collection")
-    except Exception as e:
-        print(f"Note: Could not delete existing Author collection: {e}")
-
-    try:
-        author_collection = client.collections.create(
-            name="Author",
-            vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
-            generative_config=Configure.Generative.openai(),
-            properties=[
-                Property(name="name", data_type=DataType.TEXT),
-                Property(name="bio", data_type=DataType.TEXT),
-                Property(name="birthYear", data_type=DataType.INT),
-                Property(name="isActive", data_type=DataType.BOOL),
-                Property(
-                    name="address",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="street", data_type=DataType.TEXT),
-                        Property(name="city", data_type=DataType.TEXT),
-                        Property(name="country", data_type=DataType.TEXT),
-                        Property(name="zipCode", data_type=DataType.TEXT),
-                    ]
-                ),
-                Property(name="coordinates", data_type=DataType.GEO_COORDINATES),
-            ]
-        )
-        print("✓ Author collection created successfully!")
-    except Exception as e:
-        print(f"✗ Failed to create Author collection: {e}")
+        log.error("✗ Failed to import Jeopardy questions: %s", e)
         return False
 
-    # Collection 2: Publisher
-    print("Creating Publisher collection...")
-    try:
-        if client.collections.exists("Publisher"):
-            client.collections.delete("Publisher")
-            print("✓ Deleted existing Publisher collection")
-    except Exception as e:
-        print(f"Note: Could not delete existing Publisher collection: {e}")
-
-    try:
-        publisher_collection = client.collections.create(
-            name="Publisher",
-            vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
-            generative_config=Configure.Generative.openai(),
-            properties=[
-                Property(name="name", data_type=DataType.TEXT),
-                Property(name="foundedYear", data_type=DataType.INT),
-                Property(name="website", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(
-                    name="contactInfo",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="email", data_type=DataType.TEXT),
-                        Property(name="phone", data_type=DataType.TEXT),
-                        Property(name="address", data_type=DataType.TEXT),
-                    ]
-                ),
-                Property(name="headquarters", data_type=DataType.GEO_COORDINATES),
-            ]
-        )
-        print("✓ Publisher collection created successfully!")
-    except Exception as e:
-        print(f"✗ Failed to create Publisher collection: {e}")
-        return False
 
-    # Collection 3: Book
-    print("Creating Book collection...")
-    try:
-        if client.collections.exists("Book"):
-            client.collections.delete("Book")
-            print("✓ Deleted existing Book collection")
-    except Exception as e:
-        print(f"Note: Could not delete existing Book collection: {e}")
+BOOK_DOMAIN_SCHEMAS = {
+    "Author": dict(
+        vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
+        generative_config=Configure.Generative.openai(),
+        properties=[
+            Property(name="name", data_type=DataType.TEXT),
+            Property(name="bio", data_type=DataType.TEXT),
+            Property(name="birthYear", data_type=DataType.INT),
+            Property(name="isActive", data_type=DataType.BOOL),
+            Property(
+                name="address",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="street", data_type=DataType.TEXT),
+                    Property(name="city", data_type=DataType.TEXT),
+                    Property(name="country", data_type=DataType.TEXT),
+                    Property(name="zipCode", data_type=DataType.TEXT),
+                ]
+            ),
+            Property(name="coordinates", data_type=DataType.GEO_COORDINATES),
+        ]
+    ),
+    "Publisher": dict(
+        vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
+        generative_config=Configure.Generative.openai(),
+        properties=[
+            Property(name="name", data_type=DataType.TEXT),
+            Property(name="foundedYear", data_type=DataType.INT),
+            Property(name="website", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(
+                name="contactInfo",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="email", data_type=DataType.TEXT),
+                    Property(name="phone", data_type=DataType.TEXT),
+                    Property(name="address", data_type=DataType.TEXT),
+                ]
+            ),
+            Property(name="headquarters", data_type=DataType.GEO_COORDINATES),
+        ]
+    ),
+    "Book": dict(
+        vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
+        generative_config=Configure.Generative.openai(),
+        properties=[
+            Property(name="title", data_type=DataType.TEXT),
+            Property(name="description", data_type=DataType.TEXT),
+            Property(name="isbn", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="publishedDate", data_type=DataType.DATE),
+            Property(name="pageCount", data_type=DataType.INT),
+            Property(name="price", data_type=DataType.NUMBER),
+            Property(name="inStock", data_type=DataType.BOOL),
+            Property(name="genre", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(
+                name="metadata",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="language", data_type=DataType.TEXT),
+                    Property(name="edition", data_type=DataType.TEXT),
+                    Property(name="format", data_type=DataType.TEXT),
+                    Property(name="weight", data_type=DataType.NUMBER),
+                ]
+            ),
+        ],
+        references=[
+            ReferenceProperty(name="writtenBy", target_collection="Author"),
+            ReferenceProperty(name="publishedBy", target_collection="Publisher"),
+        ]
+    ),
+    "Review": dict(
+        vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
+        generative_config=Configure.Generative.openai(),
+        properties=[
+            Property(name="title", data_type=DataType.TEXT),
+            Property(name="content", data_type=DataType.TEXT),
+            Property(name="rating", data_type=DataType.INT),
+            Property(name="reviewDate", data_type=DataType.DATE),
+            Property(name="verified", data_type=DataType.BOOL),
+            Property(
+                name="reviewer",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="name", data_type=DataType.TEXT),
+                    Property(name="email", data_type=DataType.TEXT),
+                    Property(name="memberSince", data_type=DataType.DATE),
+                    Property(name="totalReviews", data_type=DataType.INT),
+                ]
+            ),
+        ],
+        references=[
+            ReferenceProperty(name="reviewsBook", target_collection="Book"),
+        ]
+    ),
+}
 
-    try:
-        book_collection = client.collections.create(
-            name="Book",
-            vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
-            generative_config=Configure.Generative.openai(),
-            properties=[
-                Property(name="title", data_type=DataType.TEXT),
-                Property(name="description", data_type=DataType.TEXT),
-                Property(name="isbn", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(name="publishedDate", data_type=DataType.DATE),
-                Property(name="pageCount", data_type=DataType.INT),
-                Property(name="price", data_type=DataType.NUMBER),
-                Property(name="inStock", data_type=DataType.BOOL),
-                Property(name="genre", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(
-                    name="metadata",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="language", data_type=DataType.TEXT),
-                        Property(name="edition", data_type=DataType.TEXT),
-                        Property(name="format", data_type=DataType.TEXT),
-                        Property(name="weight", data_type=DataType.NUMBER),
-                    ]
-                ),
-            ],
-            references=[
-                wvc.config.ReferenceProperty(name="writtenBy", target_collection="Author"),
-                wvc.config.ReferenceProperty(name="publishedBy", target_collection="Publisher"),
-            ]
-        )
-        print("✓ Book collection created successfully!")
-    except Exception as e:
-        print(f"✗ Failed to create Book collection: {e}")
-        return False
+# Creation order: each tier only references collections from earlier tiers,
+# so the collections within a tier are created concurrently.
+BOOK_DOMAIN_TIERS = (("Author", "Publisher"), ("Book",), ("Review",))
 
-    # Collection 4: Review
-    print("Creating Review collection...")
-    try:
-        if client.collections.exists("Review"):
-            client.collections.delete("Review")
-            print("✓ Deleted existing Review collection")
-    except Exception as e:
-        print(f"Note: Could not delete existing Review collection: {e}")
 
-    try:
-        review_collection = client.collections.create(
-            name="Review",
-            vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
-            generative_config=Configure.Generative.openai(),
-            properties=[
-                Property(name="title", data_type=DataType.TEXT),
-                Property(name="content", data_type=DataType.TEXT),
-                Property(name="rating", data_type=DataType.INT),
-                Property(name="reviewDate", data_type=DataType.DATE),
-                Property(name="verified", data_type=DataType.BOOL),
-                Property(
-                    name="reviewer",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="name", data_type=DataType.TEXT),
-                        Property(name="email", data_type=DataType.TEXT),
-                        Property(name="memberSince", data_type=DataType.DATE),
-                        Property(name="totalReviews", data_type=DataType.INT),
-                    ]
-                ),
-            ],
-            references=[
-                wvc.config.ReferenceProperty(name="reviewsBook", target_collection="Book"),
-            ]
-        )
-        print("✓ Review collection created successfully!")
-    except Exception as e:
-        print(f"✗ Failed to create Review collection: {e}")
-        return False
+def create_book_collections(client):
+    """Create and populate Author, Publisher, Book, and Review collections"""
+    log.info("\n=== Creating Book Domain Collections ===")
+    drop_collections(client, ["Review", "Book", "Publisher", "Author"])
+    create_collections(client, BOOK_DOMAIN_SCHEMAS, BOOK_DOMAIN_TIERS)
 
     # Populate with sample data
-    print("\nPopulating book domain collections...")
+    log.info("\nPopulating book domain collections...")
 
     authors_data = [
         {
@@ -395,14 +652,14 @@ def create_book_collections(client):
         }
     ]
 
-    author_ids = []
-    for author_data in authors_data:
-        try:
-            result = author_collection.data.insert(author_data)
-            author_ids.append(result)
-            print(f"✓ Inserted author: {author_data['name']}")
-        except Exception as e:
-            print(f"✗ Failed to insert author {author_data['name']}: {e}")
+    # Deterministic UUIDs let books and reviews reference their targets
+    # without waiting for the server to assign IDs, so the whole domain is
+    # written in one batch at the end.
+    author_ids = [generate_uuid5(author_data["name"]) for author_data in authors_data]
+    objects = [
+        ("Author", wvc.data.DataObject(properties=author_data, uuid=author_id))
+        for author_data, author_id in zip(authors_data, author_ids)
+    ]
 
     publishers_data = [
         {
@@ -428,14 +685,11 @@ def create_book_collections(client):
         }
     ]
 
-    publisher_ids = []
-    for publisher_data in publishers_data:
-        try:
-            result = publisher_collection.data.insert(publisher_data)
-            publisher_ids.append(result)
-            print(f"✓ Inserted publisher: {publisher_data['name']}")
-        except Exception as e:
-            print(f"✗ Failed to insert publisher {publisher_data['name']}: {e}")
+    publisher_ids = [generate_uuid5(publisher_data["name"]) for publisher_data in publishers_data]
+    objects += [
+        ("Publisher", wvc.data.DataObject(properties=publisher_data, uuid=publisher_id))
+        for publisher_data, publisher_id in zip(publishers_data, publisher_ids)
+    ]
 
     books_data = [
         {
@@ -473,20 +727,17 @@ def create_book_collections(client):
         }
     ]
 
-    book_ids = []
-    for i, book_data in enumerate(books_data):
-        try:
-            result = book_collection.data.insert(
-                properties=book_data,
-                references={
-                    "writtenBy": author_ids[i] if i < len(author_ids) else author_ids[0],
-                    "publishedBy": publisher_ids[i] if i < len(publisher_ids) else publisher_ids[0]
-                }
-            )
-            book_ids.append(result)
-            print(f"✓ Inserted book: {book_data['title']}")
-        except Exception as e:
-            print(f"✗ Failed to insert book {book_data['title']}: {e}")
+    book_ids = [generate_uuid5(book_data["isbn"]) for book_data in books_data]
+    objects += [
+        ("Book", wvc.data.DataObject(
+            properties=book_data,
+            uuid=book_id,
+            references={"writtenBy": author_id, "publishedBy": publisher_id},
+        ))
+        for book_data, book_id, author_id, publisher_id in zip(
+            books_data, book_ids, author_ids, publisher_ids
+        )
+    ]
 
     reviews_data = [
         {
@@ -515,345 +766,505 @@ def create_book_collections(client):
         }
     ]
 
-    for i, review_data in enumerate(reviews_data):
-        try:
-            review_collection.data.insert(
-                properties=review_data,
-                references={"reviewsBook": book_ids[i] if i < len(book_ids) else book_ids[0]}
-            )
-            print(f"✓ Inserted review: {review_data['title']}")
-        except Exception as e:
-            print(f"✗ Failed to insert review {review_data['title']}: {e}")
+    objects += [
+        ("Review", wvc.data.DataObject(
+            properties=review_data,
+            uuid=generate_uuid5(review_data["title"]),
+            references={"reviewsBook": book_id},
+        ))
+        for review_data, book_id in zip(reviews_data, book_ids)
+    ]
 
-    print("✓ Book domain collections populated successfully!")
+    inserted = client_batch_insert(client, "book domain object", objects)
+    log.info("✓ Inserted %s/%s authors, publishers, books and reviews", inserted, len(objects))
+
+    log.info("✓ Book domain collections populated successfully!")
     return True
 
 
-def create_github_collections(client, skip_github=False):
-    """Create and populate GitHub collections"""
-    print("\n=== Creating GitHub Collections ===")
+def respect_rate_limit(response) -> None:
+    """Sleep until the GitHub rate-limit window resets if it is nearly used up."""
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None or int(remaining) >= GITHUB_RATE_LIMIT_FLOOR:
+        return
+    wait = max(0.0, int(reset) - time.time()) + 1
+    if wait > GITHUB_MAX_RATE_LIMIT_WAIT:
+        log.warning("⚠ GitHub rate limit nearly exhausted (%s left, resets in %.0fs)", remaining, wait)
+        return
+    log.info("⏳ GitHub rate limit nearly exhausted, waiting %.0fs for reset …", wait)
+    time.sleep(wait)
 
-    # Collection 1: GitHubUser
-    print("Creating GitHubUser collection...")
-    try:
-        if client.collections.exists("GitHubUser"):
-            client.collections.delete("GitHubUser")
-            print("✓ Deleted existing GitHubUser collection")
-    except Exception as e:
-        print(f"Note: Could not delete existing GitHubUser collection: {e}")
 
-    try:
-        github_user_collection = client.collections.create(
-            name="GitHubUser",
-            vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
-            generative_config=Configure.Generative.openai(),
-            properties=[
-                Property(name="login", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(name="name", data_type=DataType.TEXT),
-                Property(name="bio", data_type=DataType.TEXT),
-                Property(name="company", data_type=DataType.TEXT),
-                Property(name="location", data_type=DataType.TEXT),
-                Property(name="email", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(name="hireable", data_type=DataType.BOOL),
-                Property(name="createdAt", data_type=DataType.DATE),
-                Property(
-                    name="stats",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="publicRepos", data_type=DataType.INT),
-                        Property(name="publicGists", data_type=DataType.INT),
-                        Property(name="followers", data_type=DataType.INT),
-                        Property(name="following", data_type=DataType.INT),
-                    ]
-                ),
-                Property(
-                    name="urls",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="htmlUrl", data_type=DataType.TEXT),
-                        Property(name="blog", data_type=DataType.TEXT),
-                        Property(name="twitterUsername", data_type=DataType.TEXT),
-                    ]
-                ),
-            ]
-        )
-        print("✓ GitHubUser collection created successfully!")
-    except Exception as e:
-        print(f"✗ Failed to create GitHubUser collection: {e}")
-        return False
+github_failures = 0
+github_failures_lock = threading.Lock()
 
-    # Collection 2: GitHubRepo
-    print("Creating GitHubRepo collection...")
+
+def parse_retry_after(value: str):
+    """Return a Retry-After header (seconds or HTTP-date) as seconds, or None if malformed."""
     try:
-        if client.collections.exists("GitHubRepo"):
-            client.collections.delete("GitHubRepo")
-            print("✓ Deleted existing GitHubRepo collection")
-    except Exception as e:
-        print(f"Note: Could not delete existing GitHubRepo collection: {e}")
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def github_retry_delay(response, attempt: int):
+    """Return seconds to wait before retrying *response*, or None if it is not rate limited."""
+    headers = response.headers
+    if response.status_code == 403:
+        # GitHub signals both primary and secondary rate limits with a 403.
+        rate_limited = "Retry-After" in headers or headers.get("X-RateLimit-Remaining") == "0"
+    else:
+        rate_limited = response.status_code == 429
+    if not rate_limited:
+        return None
+    delay = parse_retry_after(headers["Retry-After"]) if "Retry-After" in headers else None
+    if delay is not None:
+        return delay
+    if headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+        return max(0.0, int(headers["X-RateLimit-Reset"]) - time.time()) + 1
+    # Full jitter keeps the concurrent fetch workers from retrying in lockstep.
+    return random.uniform(0, min(GITHUB_MAX_RATE_LIMIT_WAIT, 2 ** attempt))
+
+
+def github_get(path: str, headers: dict):
+    """GET *path* from the GitHub API, retrying rate limits up to GITHUB_MAX_ATTEMPTS times.
+    Returns None while the circuit breaker is open; transport errors raise RequestException."""
+    global github_failures
+    if github_failures >= GITHUB_CIRCUIT_BREAKER_THRESHOLD:
+        return None
 
+    failed = True
     try:
-        github_repo_collection = client.collections.create(
-            name="GitHubRepo",
-            vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
-            generative_config=Configure.Generative.openai(),
-            properties=[
-                Property(name="name", data_type=DataType.TEXT),
-                Property(name="fullName", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(name="description", data_type=DataType.TEXT),
-                Property(name="language", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(name="private", data_type=DataType.BOOL),
-                Property(name="fork", data_type=DataType.BOOL),
-                Property(name="archived", data_type=DataType.BOOL),
-                Property(name="createdAt", data_type=DataType.DATE),
-                Property(name="updatedAt", data_type=DataType.DATE),
-                Property(name="pushedAt", data_type=DataType.DATE),
-                Property(name="size", data_type=DataType.INT),
-                Property(
-                    name="metrics",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="stargazersCount", data_type=DataType.INT),
-                        Property(name="watchersCount", data_type=DataType.INT),
-                        Property(name="forksCount", data_type=DataType.INT),
-                        Property(name="openIssuesCount", data_type=DataType.INT),
-                    ]
-                ),
-                Property(name="topics", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(
-                    name="license",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="key", data_type=DataType.TEXT),
-                        Property(name="name", data_type=DataType.TEXT),
-                        Property(name="spdxId", data_type=DataType.TEXT),
-                    ]
-                ),
-            ],
-            references=[
-                wvc.config.ReferenceProperty(name="ownedBy", target_collection="GitHubUser"),
-            ]
-        )
-        print("✓ GitHubRepo collection created successfully!")
-    except Exception as e:
-        print(f"✗ Failed to create GitHubRepo collection: {e}")
-        return False
+        for attempt in range(1, GITHUB_MAX_ATTEMPTS + 1):
+            response = GITHUB_SESSION.get(f"{GITHUB_API_URL}{path}", headers=headers, timeout=10)
+            delay = github_retry_delay(response, attempt)
+            if delay is None:
+                failed = response.status_code >= 500
+                return response
+            if attempt == GITHUB_MAX_ATTEMPTS or delay > GITHUB_MAX_RATE_LIMIT_WAIT:
+                return response
+            log.warning("⚠ GitHub request %s rate limited (HTTP %s); retrying in %.1fs", path, response.status_code, delay)
+            time.sleep(delay)
+    finally:
+        with github_failures_lock:
+            github_failures = github_failures + 1 if failed else 0
+            if github_failures == GITHUB_CIRCUIT_BREAKER_THRESHOLD:
+                log.warning("⚠ %s GitHub requests failed in a row; skipping the remaining GitHub requests", github_failures)
+
+
+def fetch_github_json(path: str):
+    """Return the decoded JSON for GitHub *path*, or None on failure.
+    Responses are ETag-cached in GITHUB_CACHE_DIR and reused as-is for GITHUB_CACHE_TTL seconds."""
+    key = hashlib.sha1(path.encode("utf-8")).hexdigest()
+    body_path = GITHUB_CACHE_DIR / f"{key}.json"
+    etag_path = GITHUB_CACHE_DIR / f"{key}.etag"
+    cached = None
+    headers = GITHUB_HEADERS
+    if body_path.exists() and not REFRESH_CACHE:
+        cached = body_path.read_bytes()
+        if time.time() - body_path.stat().st_mtime < GITHUB_CACHE_TTL:
+            return load_json(cached)
+        if etag_path.exists():
+            headers = {**GITHUB_HEADERS, "If-None-Match": etag_path.read_text()}
 
-    # Collection 3: GitHubIssue
-    print("Creating GitHubIssue collection...")
     try:
-        if client.collections.exists("GitHubIssue"):
-            client.collections.delete("GitHubIssue")
-            print("✓ Deleted existing GitHubIssue collection")
-    except Exception as e:
-        print(f"Note: Could not delete existing GitHubIssue collection: {e}")
+        response = github_get(path, headers)
+    except requests.RequestException as exc:
+        if cached is not None:
+            log.warning("⚠ GitHub request %s failed (%s); using cached response", path, exc)
+            return load_json(cached)
+        log.error("✗ GitHub request %s failed: %s", path, exc)
+        return None
+    if response is None:
+        return load_json(cached) if cached is not None else None
+    respect_rate_limit(response)
+    if response.status_code == 304 and cached is not None:
+        body_path.touch()  # still current – restart its freshness window
+        return load_json(cached)
+    if response.status_code != 200:
+        if cached is not None:
+            log.warning("⚠ GitHub request %s failed (HTTP %s); using cached response", path, response.status_code)
+            return load_json(cached)
+        log.error("✗ GitHub request %s failed: HTTP %s", path, response.status_code)
+        return None
+
+    GITHUB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = body_path.with_name(body_path.name + ".tmp")
+    tmp_path.write_bytes(response.content)
+    tmp_path.replace(body_path)
+    etag = response.headers.get("ETag")
+    if etag:
+        etag_path.write_text(etag)
+    else:
+        etag_path.unlink(missing_ok=True)
+    return load_json(response.content)
+
+
+GITHUB_USER_KEYMAP = (
+    ("login", "login", ""),
+    ("name", "name", ""),
+    ("bio", "bio", ""),
+    ("company", "company", ""),
+    ("location", "location", ""),
+    ("email", "email", ""),
+    ("hireable", "hireable", False),
+    ("createdAt", "created_at", None),
+)
+GITHUB_USER_STATS_KEYMAP = (
+    ("publicRepos", "public_repos", 0),
+    ("publicGists", "public_gists", 0),
+    ("followers", "followers", 0),
+    ("following", "following", 0),
+)
+GITHUB_USER_URLS_KEYMAP = (
+    ("htmlUrl", "html_url", ""),
+    ("blog", "blog", ""),
+    ("twitterUsername", "twitter_username", ""),
+)
+GITHUB_REPO_KEYMAP = (
+    ("name", "name", ""),
+    ("fullName", "full_name", ""),
+    ("language", "language", ""),
+    ("private", "private", False),
+    ("fork", "fork", False),
+    ("archived", "archived", False),
+    ("createdAt", "created_at", None),
+    ("updatedAt", "updated_at", None),
+    ("pushedAt", "pushed_at", None),
+    ("size", "size", 0),
+)
+GITHUB_REPO_METRICS_KEYMAP = (
+    ("stargazersCount", "stargazers_count", 0),
+    ("watchersCount", "watchers_count", 0),
+    ("forksCount", "forks_count", 0),
+    ("openIssuesCount", "open_issues_count", 0),
+)
+GITHUB_LICENSE_KEYMAP = (
+    ("key", "key", ""),
+    ("name", "name", ""),
+    ("spdxId", "spdx_id", ""),
+)
+GITHUB_ISSUE_KEYMAP = (
+    ("title", "title", ""),
+    ("number", "number", 0),
+    ("state", "state", ""),
+    ("locked", "locked", False),
+    ("createdAt", "created_at", None),
+    ("updatedAt", "updated_at", None),
+    ("closedAt", "closed_at", None),
+)
+GITHUB_REACTIONS_KEYMAP = (
+    ("totalCount", "total_count", 0),
+    ("plusOne", "+1", 0),
+    ("minusOne", "-1", 0),
+    ("laugh", "laugh", 0),
+    ("hooray", "hooray", 0),
+    ("confused", "confused", 0),
+    ("heart", "heart", 0),
+    ("rocket", "rocket", 0),
+    ("eyes", "eyes", 0),
+)
+
+# Bound once, so mapping a payload reuses the same mapper.
+map_github_user = row_mapper(GITHUB_USER_KEYMAP)
+map_github_user_stats = row_mapper(GITHUB_USER_STATS_KEYMAP)
+map_github_user_urls = row_mapper(GITHUB_USER_URLS_KEYMAP)
+map_github_repo = row_mapper(GITHUB_REPO_KEYMAP)
+map_github_repo_metrics = row_mapper(GITHUB_REPO_METRICS_KEYMAP)
+map_github_license = row_mapper(GITHUB_LICENSE_KEYMAP)
+map_github_issue = row_mapper(GITHUB_ISSUE_KEYMAP)
+map_github_reactions = row_mapper(GITHUB_REACTIONS_KEYMAP)
 
+
+def github_result(future, label: str):
+    """Return the result of a GitHub fetch *future*, or None after logging its error."""
     try:
-        github_issue_collection = client.collections.create(
-            name="GitHubIssue",
-            vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
-            generative_config=Configure.Generative.openai(),
-            properties=[
-                Property(name="title", data_type=DataType.TEXT),
-                Property(name="body", data_type=DataType.TEXT),
-                Property(name="number", data_type=DataType.INT),
-                Property(name="state", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(name="locked", data_type=DataType.BOOL),
-                Property(name="createdAt", data_type=DataType.DATE),
-                Property(name="updatedAt", data_type=DataType.DATE),
-                Property(name="closedAt", data_type=DataType.DATE),
-                Property(
-                    name="labels",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="names", data_type=DataType.TEXT),
-                        Property(name="colors", data_type=DataType.TEXT),
-                        Property(name="count", data_type=DataType.INT),
-                    ]
-                ),
-                Property(
-                    name="reactions",
-                    data_type=DataType.OBJECT,
-                    nested_properties=[
-                        Property(name="totalCount", data_type=DataType.INT),
-                        Property(name="plusOne", data_type=DataType.INT),
-                        Property(name="minusOne", data_type=DataType.INT),
-                        Property(name="laugh", data_type=DataType.INT),
-                        Property(name="hooray", data_type=DataType.INT),
-                        Property(name="confused", data_type=DataType.INT),
-                        Property(name="heart", data_type=DataType.INT),
-                        Property(name="rocket", data_type=DataType.INT),
-                        Property(name="eyes", data_type=DataType.INT),
-                    ]
-                ),
-            ],
-            references=[
-                wvc.config.ReferenceProperty(name="belongsToRepo", target_collection="GitHubRepo"),
-                wvc.config.ReferenceProperty(name="createdBy", target_collection="GitHubUser"),
-            ]
-        )
-        print("✓ GitHubIssue collection created successfully!")
+        return future.result()
     except Exception as e:
-        print(f"✗ Failed to create GitHubIssue collection: {e}")
-        return False
+        log.error("✗ Failed to fetch %s: %s", label, e)
+        return None
+
+
+def github_user_properties(user_data: dict) -> dict:
+    """Map a GitHub ``/users/{login}`` payload to GitHubUser properties."""
+    return {
+        **map_github_user(user_data),
+        "stats": map_github_user_stats(user_data),
+        "urls": map_github_user_urls(user_data),
+    }
+
+
+def github_repo_properties(repo_data: dict) -> dict:
+    """Map a GitHub repository payload to GitHubRepo properties."""
+    return {
+        **map_github_repo(repo_data),
+        "description": truncate_utf8(repo_data.get("description"), 1000),
+        "metrics": map_github_repo_metrics(repo_data),
+        "topics": ", ".join(repo_data.get("topics") or []),
+        "license": map_github_license(repo_data.get("license") or {}),
+    }
+
+
+def github_issue_properties(issue_data: dict) -> dict:
+    """Map a GitHub issue payload to GitHubIssue properties."""
+    labels = issue_data.get("labels") or []
+    labels_names = [label.get("name", "") for label in labels]
+    labels_colors = [label.get("color", "") for label in labels]
+
+    return {
+        **map_github_issue(issue_data),
+        "body": truncate_utf8(issue_data.get("body"), 1000),
+        "labels": {
+            "names": ", ".join(labels_names),
+            "colors": ", ".join(labels_colors),
+            "count": len(labels_names),
+        },
+        "reactions": map_github_reactions(issue_data.get("reactions") or {}),
+    }
+
+
+GITHUB_SCHEMAS = {
+    "GitHubUser": dict(
+        vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
+        generative_config=Configure.Generative.openai(),
+        properties=[
+            Property(name="login", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="name", data_type=DataType.TEXT),
+            Property(name="bio", data_type=DataType.TEXT),
+            Property(name="company", data_type=DataType.TEXT),
+            Property(name="location", data_type=DataType.TEXT),
+            Property(name="email", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="hireable", data_type=DataType.BOOL),
+            Property(name="createdAt", data_type=DataType.DATE),
+            Property(
+                name="stats",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="publicRepos", data_type=DataType.INT),
+                    Property(name="publicGists", data_type=DataType.INT),
+                    Property(name="followers", data_type=DataType.INT),
+                    Property(name="following", data_type=DataType.INT),
+                ]
+            ),
+            Property(
+                name="urls",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="htmlUrl", data_type=DataType.TEXT),
+                    Property(name="blog", data_type=DataType.TEXT),
+                    Property(name="twitterUsername", data_type=DataType.TEXT),
+                ]
+            ),
+        ]
+    ),
+    "GitHubRepo": dict(
+        vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
+        generative_config=Configure.Generative.openai(),
+        properties=[
+            Property(name="name", data_type=DataType.TEXT),
+            Property(name="fullName", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="description", data_type=DataType.TEXT),
+            Property(name="language", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="private", data_type=DataType.BOOL),
+            Property(name="fork", data_type=DataType.BOOL),
+            Property(name="archived", data_type=DataType.BOOL),
+            Property(name="createdAt", data_type=DataType.DATE),
+            Property(name="updatedAt", data_type=DataType.DATE),
+            Property(name="pushedAt", data_type=DataType.DATE),
+            Property(name="size", data_type=DataType.INT),
+            Property(
+                name="metrics",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="stargazersCount", data_type=DataType.INT),
+                    Property(name="watchersCount", data_type=DataType.INT),
+                    Property(name="forksCount", data_type=DataType.INT),
+                    Property(name="openIssuesCount", data_type=DataType.INT),
+                ]
+            ),
+            Property(name="topics", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(
+                name="license",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="key", data_type=DataType.TEXT),
+                    Property(name="name", data_type=DataType.TEXT),
+                    Property(name="spdxId", data_type=DataType.TEXT),
+                ]
+            ),
+        ],
+        references=[
+            ReferenceProperty(name="ownedBy", target_collection="GitHubUser"),
+        ]
+    ),
+    "GitHubIssue": dict(
+        vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
+        generative_config=Configure.Generative.openai(),
+        properties=[
+            Property(name="title", data_type=DataType.TEXT),
+            Property(name="body", data_type=DataType.TEXT),
+            Property(name="number", data_type=DataType.INT),
+            Property(name="state", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="locked", data_type=DataType.BOOL),
+            Property(name="createdAt", data_type=DataType.DATE),
+            Property(name="updatedAt", data_type=DataType.DATE),
+            Property(name="closedAt", data_type=DataType.DATE),
+            Property(
+                name="labels",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="names", data_type=DataType.TEXT),
+                    Property(name="colors", data_type=DataType.TEXT),
+                    Property(name="count", data_type=DataType.INT),
+                ]
+            ),
+            Property(
+                name="reactions",
+                data_type=DataType.OBJECT,
+                nested_properties=[
+                    Property(name="totalCount", data_type=DataType.INT),
+                    Property(name="plusOne", data_type=DataType.INT),
+                    Property(name="minusOne", data_type=DataType.INT),
+                    Property(name="laugh", data_type=DataType.INT),
+                    Property(name="hooray", data_type=DataType.INT),
+                    Property(name="confused", data_type=DataType.INT),
+                    Property(name="heart", data_type=DataType.INT),
+                    Property(name="rocket", data_type=DataType.INT),
+                    Property(name="eyes", data_type=DataType.INT),
+                ]
+            ),
+        ],
+        references=[
+            ReferenceProperty(name="belongsToRepo", target_collection="GitHubRepo"),
+            ReferenceProperty(name="createdBy", target_collection="GitHubUser"),
+        ]
+    ),
+}
+
+GITHUB_TIERS = (("GitHubUser",), ("GitHubRepo",), ("GitHubIssue",))
+
+
+def create_github_collections(client, skip_github=False):
+    """Create and populate GitHub collections"""
+    log.info("\n=== Creating GitHub Collections ===")
+    drop_collections(client, ["GitHubIssue", "GitHubRepo", "GitHubUser"])
+    created = create_collections(client, GITHUB_SCHEMAS, GITHUB_TIERS)
+    github_user_collection = created["GitHubUser"]
+    github_repo_collection = created["GitHubRepo"]
+    github_issue_collection = created["GitHubIssue"]
 
     if skip_github:
-        print("⏭️  Skipping GitHub data fetching (--skip-github flag)")
+        log.info("⏭️  Skipping GitHub data fetching (--skip-github flag)")
         return True
 
-    # Fetch real GitHub data
-    print("\nFetching real GitHub data...")
-    popular_users = ["torvalds", "gaearon", "sindresorhus", "tj", "addyosmani"]
-    user_ids = []
-    repo_ids = []
-
-    for username in popular_users:
-        try:
-            print(f"Fetching user: {username}")
-            response = requests.get(f"https://api.github.com/users/{username}", timeout=10)
-
-            if response.status_code == 200:
-                user_data = response.json()
-
-                user_obj = {
-                    "login": user_data.get("login", ""),
-                    "name": user_data.get("name", ""),
-                    "bio": user_data.get("bio", ""),
-                    "company": user_data.get("company", ""),
-                    "location": user_data.get("location", ""),
-                    "email": user_data.get("email", ""),
-                    "hireable": user_data.get("hireable", False) if user_data.get("hireable") is not None else False,
-                    "createdAt": user_data.get("created_at", ""),
-                    "stats": {
-                        "publicRepos": user_data.get("public_repos", 0),
-                        "publicGists": user_data.get("public_gists", 0),
-                        "followers": user_data.get("followers", 0),
-                        "following": user_data.get("following", 0),
-                    },
-                    "urls": {
-                        "htmlUrl": user_data.get("html_url", ""),
-                        "blog": user_data.get("blog", ""),
-                        "twitterUsername": user_data.get("twitter_username", ""),
-                    }
-                }
-
-                result = github_user_collection.data.insert(user_obj)
-                user_ids.append(result)
-                print(f"✓ Inserted user: {user_data.get('name', username)}")
-
-                repos_response = requests.get(
-                    f"https://api.github.com/users/{username}/repos?sort=stars&per_page=3",
-                    timeout=10
+    # Fetch real GitHub data – user profiles and repo lists are independent
+    # requests, so they are fetched concurrently. The issue requests depend
+    # only on the repo lists and are in flight while users and repos import.
+    log.info("\nFetching real GitHub data...")
+    usernames = GITHUB_USERS
+    if KEEP_EXISTING:
+        # Users imported by an earlier run are kept together with their repos
+        # and issues, so none of their GitHub requests are made again.
+        usernames = [
+            username for username in usernames
+            if not github_user_collection.data.exists(generate_uuid5(username.lower()))
+        ]
+        skipped = len(GITHUB_USERS) - len(usernames)
+        if skipped:
+            log.info("• Skipping %s GitHub users already in GitHubUser (--keep-existing)", skipped)
+    with ThreadPoolExecutor(max_workers=GITHUB_FETCH_WORKERS) as pool:
+        user_futures = [
+            pool.submit(fetch_github_json, f"/users/{username}")
+            for username in usernames
+        ]
+        repo_futures = [
+            pool.submit(fetch_github_json, f"/users/{username}/repos?sort=stars&per_page=3")
+            for username in usernames
+        ]
+        fetched = [
+            (
+                username,
+                github_result(user_future, f"user {username}"),
+                github_result(repo_future, f"repos of {username}") or [],
+            )
+            for username, user_future, repo_future in zip(usernames, user_futures, repo_futures)
+        ]
+
+        # UUIDs are derived from GitHub's own identifiers, so cross-references can
+        # be wired before anything is written and every import can be batched.
+        user_objects = []
+        repo_objects = []
+        repo_sources = []
+        for username, user_data, repos_data in fetched:
+            if not user_data:
+                continue
+            try:
+                # GitHub logins are case-insensitive, so the id is keyed on the lowercase form.
+                user_id = generate_uuid5(user_data.get("login").lower())
+                user_object = wvc.data.DataObject(
+                    properties=github_user_properties(user_data), uuid=user_id
+                )
+                user_repos = []
+                for repo_data in repos_data[:2]:
+                    full_name = repo_data.get("full_name")
+                    repo_id = generate_uuid5(full_name)
+                    user_repos.append((full_name, repo_id, wvc.data.DataObject(
+                        properties=github_repo_properties(repo_data),
+                        uuid=repo_id,
+                        references={"ownedBy": user_id},
+                    )))
+            except Exception as e:
+                log.error("✗ Failed to process user %s: %s", username, e)
+                continue
+            user_objects.append(user_object)
+            for full_name, repo_id, repo_object in user_repos:
+                repo_objects.append(repo_object)
+                issues_future = pool.submit(
+                    fetch_github_json, f"/repos/{full_name}/issues?state=all&per_page=5"
                 )
+                repo_sources.append((full_name, repo_id, user_id, issues_future))
 
-                if repos_response.status_code == 200:
-                    repos_data = repos_response.json()
-
-                    for repo_data in repos_data[:2]:
-                        try:
-                            repo_obj = {
-                                "name": repo_data.get("name", ""),
-                                "fullName": repo_data.get("full_name", ""),
-                                "description": repo_data.get("description", ""),
-                                "language": repo_data.get("language", ""),
-                                "private": repo_data.get("private", False),
-                                "fork": repo_data.get("fork", False),
-                                "archived": repo_data.get("archived", False),
-                                "createdAt": repo_data.get("created_at", ""),
-                                "updatedAt": repo_data.get("updated_at", ""),
-                                "pushedAt": repo_data.get("pushed_at", ""),
-                                "size": repo_data.get("size", 0),
-                                "metrics": {
-                                    "stargazersCount": repo_data.get("stargazers_count", 0),
-                                    "watchersCount": repo_data.get("watchers_count", 0),
-                                    "forksCount": repo_data.get("forks_count", 0),
-                                    "openIssuesCount": repo_data.get("open_issues_count", 0),
-                                },
-                                "topics": ", ".join(repo_data.get("topics", [])),
-                                "license": {
-                                    "key": repo_data.get("license", {}).get("key", "") if repo_data.get("license") else "",
-                                    "name": repo_data.get("license", {}).get("name", "") if repo_data.get("license") else "",
-                                    "spdxId": repo_data.get("license", {}).get("spdx_id", "") if repo_data.get("license") else "",
-                                } if repo_data.get("license") else {"key": "", "name": "", "spdxId": ""}
-                            }
-
-                            repo_result = github_repo_collection.data.insert(
-                                properties=repo_obj,
-                                references={"ownedBy": result}
-                            )
-                            repo_ids.append(repo_result)
-                            print(f"  ✓ Inserted repo: {repo_data.get('name', 'Unknown')}")
-
-                            issues_response = requests.get(
-                                f"https://api.github.com/repos/{repo_data.get('full_name')}/issues?state=all&per_page=2",
-                                timeout=10
-                            )
-
-                            if issues_response.status_code == 200:
-                                issues_data = issues_response.json()
-
-                                for issue_data in issues_data[:1]:
-                                    try:
-                                        if 'pull_request' in issue_data:
-                                            continue
-
-                                        labels_names = [label.get("name", "") for label in issue_data.get("labels", [])]
-                                        labels_colors = [label.get("color", "") for label in issue_data.get("labels", [])]
-
-                                        issue_obj = {
-                                            "title": issue_data.get("title", ""),
-                                            "body": (issue_data.get("body", "") or "")[:1000],
-                                            "number": issue_data.get("number", 0),
-                                            "state": issue_data.get("state", ""),
-                                            "locked": issue_data.get("locked", False),
-                                            "createdAt": issue_data.get("created_at", ""),
-                                            "updatedAt": issue_data.get("updated_at", ""),
-                                            "closedAt": issue_data.get("closed_at", ""),
-                                            "labels": {
-                                                "names": ", ".join(labels_names),
-                                                "colors": ", ".join(labels_colors),
-                                                "count": len(labels_names),
-                                            },
-                                            "reactions": {
-                                                "totalCount": issue_data.get("reactions", {}).get("total_count", 0),
-                                                "plusOne": issue_data.get("reactions", {}).get("+1", 0),
-                                                "minusOne": issue_data.get("reactions", {}).get("-1", 0),
-                                                "laugh": issue_data.get("reactions", {}).get("laugh", 0),
-                                                "hooray": issue_data.get("reactions", {}).get("hooray", 0),
-                                                "confused": issue_data.get("reactions", {}).get("confused", 0),
-                                                "heart": issue_data.get("reactions", {}).get("heart", 0),
-                                                "rocket": issue_data.get("reactions", {}).get("rocket", 0),
-                                                "eyes": issue_data.get("reactions", {}).get("eyes", 0),
-                                            }
-                                        }
-
-                                        github_issue_collection.data.insert(
-                                            properties=issue_obj,
-                                            references={
-                                                "belongsToRepo": repo_result,
-                                                "createdBy": result
-                                            }
-                                        )
-                                        print(f"    ✓ Inserted issue: {issue_data.get('title', 'Unknown')[:50]}...")
-
-                                    except Exception as e:
-                                        print(f"    ✗ Failed to insert issue: {e}")
-
-                            time.sleep(0.5)
-
-                        except Exception as e:
-                            print(f"  ✗ Failed to insert repo {repo_data.get('name', 'Unknown')}: {e}")
-
-                time.sleep(1)
+        try:
+            user_count = batch_insert(github_user_collection, "GitHub user", user_objects)
+            repo_count = batch_insert(github_repo_collection, "GitHub repo", repo_objects)
+        except Exception as e:
+            log.error("✗ Failed to import GitHub users and repos: %s", e)
+            return False
 
-            else:
-                print(f"✗ Failed to fetch user {username}: HTTP {response.status_code}")
+        issue_objects = []
+        for full_name, repo_id, user_id, issues_future in repo_sources:
+            issues = github_result(issues_future, f"issues of {full_name}") or []
+            try:
+                # The issues endpoint also lists pull requests; keep the first real issue.
+                issue_data = next((issue for issue in issues if 'pull_request' not in issue), None)
+                if issue_data is None:
+                    continue
+                issue_objects.append(
+                    wvc.data.DataObject(
+                        properties=github_issue_properties(issue_data),
+                        uuid=generate_uuid5(f"{full_name}#{issue_data.get('number')}"),
+                        references={"belongsToRepo": repo_id, "createdBy": user_id},
+                    )
+                )
+            except Exception as e:
+                log.error("✗ Failed to process issues of %s: %s", full_name, e)
 
-        except Exception as e:
-            print(f"✗ Failed to process user {username}: {e}")
+    try:
+        issue_count = batch_insert(github_issue_collection, "GitHub issue", issue_objects)
+    except Exception as e:
+        log.error("✗ Failed to import GitHub issues: %s", e)
+        return False
 
-    print("✓ GitHub collections populated successfully!")
-    print(f"  - Created {len(user_ids)} GitHub users")
-    print(f"  - Created {len(repo_ids)} GitHub repositories")
+    log.info("✓ GitHub collections populated successfully!")
+    log.info("  - Created %s GitHub users", user_count)
+    log.info("  - Created %s GitHub repositories", repo_count)
+    log.info("  - Created %s GitHub issues", issue_count)
     return True
 
 
@@ -861,19 +1272,92 @@ def create_github_collections(client, skip_github=False):
 # RAG COLLECTIONS (text-rich, generative-ready)
 # ══════════════════════════════════════════════════════════════
 
+def book_row_properties(row: dict):
+    """Map a Goodbooks-10k CSV row to Books properties, or None if it has no title."""
+    title = (row.get("title") or row.get("original_title") or "").strip()
+    if not title:
+        return None
+
+    authors = (row.get("authors") or "").strip()
+    year = safe_int(row.get("original_publication_year"))
+    rating = safe_float(row.get("average_rating"))
+    lang = (row.get("language_code") or "").strip()
+
+    content_parts = [f'"{title}" by {authors}.'] if authors else [f'"{title}".']
+    if year:
+        content_parts.append(f"Published in {year}.")
+    if rating:
+        content_parts.append(f"Average rating {rating}/5.")
+    if lang:
+        content_parts.append(f"Language: {lang}.")
+
+    return {
+        "book_id": safe_int(row.get("book_id")),
+        "goodreads_book_id": safe_int(row.get("goodreads_book_id")),
+        "title": title,
+        "authors": authors,
+        "original_publication_year": year,
+        "average_rating": rating,
+        "ratings_count": safe_int(row.get("ratings_count")),
+        "language_code": lang,
+        "image_url": (row.get("image_url") or "").strip(),
+        "small_image_url": (row.get("small_image_url") or "").strip(),
+        "content": " ".join(content_parts),
+    }
+
+
+# PodcastSearch property → CSV column used when the header detection finds none.
+PODCAST_DEFAULT_COLUMNS = (
+    ("name", "Name"),
+    ("description", "Description"),
+    ("genre_ids", "Genre IDs"),
+    ("episode_count", "Episode Count"),
+    ("itunes_url", "iTunes URL"),
+    ("podcast_url", "Podcast URL"),
+    ("feed_url", "Feed URL"),
+)
+
+
+def podcast_row_properties(row: dict, columns: dict):
+    """Map a podcasts CSV row to PodcastSearch properties, or None if it has no name.
+
+    *columns* maps every PodcastSearch property to its CSV column name.
+    """
+    name = (row.get(columns["name"]) or "").strip()
+    if not name:
+        return None
+
+    description = (row.get(columns["description"]) or "").strip()
+    genre_ids = (row.get(columns["genre_ids"]) or "").strip()
+
+    content_parts = [name]
+    if description:
+        content_parts.append(description)
+    if genre_ids:
+        content_parts.append(f"Genres: {genre_ids}.")
+
+    return {
+        "name": name,
+        "description": description,
+        "genre_ids": genre_ids,
+        "episode_count": safe_int(row.get(columns["episode_count"])),
+        "itunes_url": (row.get(columns["itunes_url"]) or "").strip(),
+        "podcast_url": (row.get(columns["podcast_url"]) or "").strip(),
+        "feed_url": (row.get(columns["feed_url"]) or "").strip(),
+        "content": ". ".join(content_parts),
+    }
+
+
 def create_rag_books_collection(client):
     """Create and populate the Books collection (Goodbooks-10k)."""
     collection_name = "Books"
-    print(f"\n{'=' * 60}")
-    print(f"  Creating {collection_name} collection (RAG)")
-    print(f"{'=' * 60}")
+    log.info("\n" + "=" * 60)
+    log.info("  Creating %s collection (RAG)", collection_name)
+    log.info("=" * 60)
 
-    if client.collections.exists(collection_name):
-        client.collections.delete(collection_name)
-        print(f"✓  Deleted existing {collection_name}")
-
-    collection = client.collections.create(
-        name=collection_name,
+    collection = recreate_collection(
+        client,
+        collection_name,
         vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
         generative_config=Configure.Generative.openai(),
         properties=[
@@ -890,73 +1374,34 @@ def create_rag_books_collection(client):
             Property(name="content", data_type=DataType.TEXT),
         ],
     )
-    print(f"✓  {collection_name} collection created")
 
     rows = download_csv(BOOKS_CSV_URL, "Books")
     if not rows:
         return 0
 
     subset = rows if BOOKS_LIMIT == 0 else rows[:BOOKS_LIMIT]
-    inserted = 0
-    for i, row in enumerate(subset):
-        title = (row.get("title") or row.get("original_title") or "").strip()
-        if not title:
-            continue
-
-        authors = (row.get("authors") or "").strip()
-        year = safe_int(row.get("original_publication_year"))
-        rating = safe_float(row.get("average_rating"))
-        lang = (row.get("language_code") or "").strip()
-
-        content_parts = [f'"{title}" by {authors}.'] if authors else [f'"{title}".']
-        if year:
-            content_parts.append(f"Published in {year}.")
-        if rating:
-            content_parts.append(f"Average rating {rating}/5.")
-        if lang:
-            content_parts.append(f"Language: {lang}.")
-        content = " ".join(content_parts)
-
-        try:
-            collection.data.insert(
-                {
-                    "book_id": safe_int(row.get("book_id")),
-                    "goodreads_book_id": safe_int(row.get("goodreads_book_id")),
-                    "title": title,
-                    "authors": authors,
-                    "original_publication_year": year,
-                    "average_rating": rating,
-                    "ratings_count": safe_int(row.get("ratings_count")),
-                    "language_code": lang,
-                    "image_url": (row.get("image_url") or "").strip(),
-                    "small_image_url": (row.get("small_image_url") or "").strip(),
-                    "content": content,
-                }
-            )
-            inserted += 1
-            if inserted % 50 == 0:
-                print(f"   Inserted {inserted} books …")
-        except Exception as exc:
-            print(f"   ⚠  Failed to insert book #{i + 1} ({title}): {exc}")
+    inserted = batch_import(
+        collection,
+        "books",
+        (props for props in map(book_row_properties, subset) if props),
+        key=lambda props: props["book_id"],
+    )
 
     total = len(subset)
-    print(f"✓  Inserted {inserted}/{total} books")
+    log.info("✓  Inserted %s/%s books", inserted, total)
     return inserted
 
 
 def create_rag_podcast_collection(client):
     """Create and populate the PodcastSearch collection."""
     collection_name = "PodcastSearch"
-    print(f"\n{'=' * 60}")
-    print(f"  Creating {collection_name} collection (RAG)")
-    print(f"{'=' * 60}")
-
-    if client.collections.exists(collection_name):
-        client.collections.delete(collection_name)
-        print(f"✓  Deleted existing {collection_name}")
+    log.info("\n" + "=" * 60)
+    log.info("  Creating %s collection (RAG)", collection_name)
+    log.info("=" * 60)
 
-    collection = client.collections.create(
-        name=collection_name,
+    collection = recreate_collection(
+        client,
+        collection_name,
         vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
         generative_config=Configure.Generative.openai(),
         properties=[
@@ -970,7 +1415,6 @@ def create_rag_podcast_collection(client):
             Property(name="content", data_type=DataType.TEXT),
         ],
     )
-    print(f"✓  {collection_name} collection created")
 
     rows = download_csv(PODCASTS_CSV_URL, "PodcastSearch")
     if not rows:
@@ -995,45 +1439,18 @@ def create_rag_podcast_collection(client):
         elif "feed" in lower and "url" in lower:
             col_map["feed_url"] = key
 
-    subset = rows if PODCASTS_LIMIT == 0 else rows[:PODCASTS_LIMIT]
-    inserted = 0
-    for i, row in enumerate(subset):
-        name = (row.get(col_map.get("name", "Name")) or "").strip()
-        if not name:
-            continue
+    columns = {prop: col_map.get(prop, default) for prop, default in PODCAST_DEFAULT_COLUMNS}
 
-        description = (row.get(col_map.get("description", "Description")) or "").strip()
-        genre_ids = (row.get(col_map.get("genre_ids", "Genre IDs")) or "").strip()
-        episode_count = safe_int(row.get(col_map.get("episode_count", "Episode Count")))
-
-        content_parts = [name]
-        if description:
-            content_parts.append(description)
-        if genre_ids:
-            content_parts.append(f"Genres: {genre_ids}.")
-        content = ". ".join(content_parts)
-
-        try:
-            collection.data.insert(
-                {
-                    "name": name,
-                    "description": description,
-                    "genre_ids": genre_ids,
-                    "episode_count": episode_count,
-                    "itunes_url": (row.get(col_map.get("itunes_url", "iTunes URL")) or "").strip(),
-                    "podcast_url": (row.get(col_map.get("podcast_url", "Podcast URL")) or "").strip(),
-                    "feed_url": (row.get(col_map.get("feed_url", "Feed URL")) or "").strip(),
-                    "content": content,
-                }
-            )
-            inserted += 1
-            if inserted % 50 == 0:
-                print(f"   Inserted {inserted} podcasts …")
-        except Exception as exc:
-            print(f"   ⚠  Failed to insert podcast #{i + 1} ({name}): {exc}")
+    subset = rows if PODCASTS_LIMIT == 0 else rows[:PODCASTS_LIMIT]
+    inserted = batch_import(
+        collection,
+        "podcasts",
+        (props for props in (podcast_row_properties(row, columns) for row in subset) if props),
+        key=lambda props: f'{props["name"]}|{props["feed_url"]}',
+    )
 
     total = len(subset)
-    print(f"✓  Inserted {inserted}/{total} podcasts")
+    log.info("✓  Inserted %s/%s podcasts", inserted, total)
     return inserted
 
 
@@ -1041,65 +1458,81 @@ def create_rag_podcast_collection(client):
 # Verification
 # ══════════════════════════════════════════════════════════════
 
+def shard_object_counts(client) -> dict:
+    """Return approximate object counts per collection, summed from node shard statistics."""
+    shards = {}
+    for node in client.cluster.nodes(output="verbose"):
+        for shard in node.shards or ():
+            key = (shard.collection, shard.name)
+            shards[key] = max(shards.get(key, 0), shard.object_count)
+    counts = {}
+    for (collection, _), object_count in shards.items():
+        counts[collection] = counts.get(collection, 0) + object_count
+    return counts
+
+
+def count_objects(client, collection_names) -> dict:
+    """Return a printable object count per collection from one aliased Aggregate query."""
+    if not collection_names:
+        return {}
+
+    alias_to_name = {f"c{i}": name for i, name in enumerate(collection_names)}
+    roots = " ".join(
+        AGGREGATE_COUNT_ROOT.format(alias=alias, name=name)
+        for alias, name in alias_to_name.items()
+    )
+    try:
+        result = client.graphql_raw_query(f"{{ Aggregate {{ {roots} }} }}")
+    except Exception as e:
+        return dict.fromkeys(collection_names, f"unknown ({e})")
+
+    aggregate = result.aggregate or {}
+    counts = {}
+    uncounted = []
+    for alias, name in alias_to_name.items():
+        agg_data = aggregate.get(alias)
+        if agg_data is None:
+            # A root that failed (e.g. a multi-tenant collection) comes back null.
+            uncounted.append(name)
+            continue
+        try:
+            counts[name] = str(agg_data[0]['meta']['count'])
+        except (KeyError, IndexError, TypeError):
+            counts[name] = "0"
+
+    if uncounted:
+        try:
+            shard_counts = shard_object_counts(client)
+        except Exception:
+            shard_counts = {}
+        for name in uncounted:
+            if name in shard_counts:
+                counts[name] = f"~{shard_counts[name]} (from shard stats)"
+            else:
+                counts[name] = "unknown"
+    return counts
+
+
 def verify_collections(client):
     """Verify all collections and show object counts"""
-    print("\n=== Verifying Collections ===")
+    log.info("\n=== Verifying Collections ===")
 
     try:
-        collections = client.collections.list_all()
-        print(f"✓ Found {len(collections)} collections:")
+        collections = list(client.collections.list_all())
+        log.info("✓ Found %s collections:", len(collections))
 
+        counts = count_objects(client, collections)
+        lines = []
         for collection_name in collections:
-            print(f"  • {collection_name}")
-
-            try:
-                headers = {
-                    'Authorization': 'Bearer test-key-123',
-                    'Content-Type': 'application/json'
-                }
-
-                query = {
-                    "query": f"""
-                    {{
-                        Aggregate {{
-                            {collection_name} {{
-                                meta {{
-                                    count
-                                }}
-                            }}
-                        }}
-                    }}
-                    """
-                }
-
-                response = requests.post(
-                    'http://localhost:8080/v1/graphql',
-                    headers=headers,
-                    json=query,
-                    timeout=5
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    if 'data' in result and 'Aggregate' in result['data']:
-                        agg_data = result['data']['Aggregate'].get(collection_name, [])
-                        if agg_data and len(agg_data) > 0:
-                            count = agg_data[0].get('meta', {}).get('count', 0)
-                            print(f"    Objects: {count}")
-                        else:
-                            print(f"    Objects: 0")
-                    else:
-                        print(f"    Objects: unknown")
-                else:
-                    print(f"    Objects: unknown (HTTP {response.status_code})")
-
-            except Exception as e:
-                print(f"    Objects: unknown ({e})")
+            lines.append(f"  • {collection_name}")
+            lines.append(f"    Objects: {counts[collection_name]}")
+        if lines:
+            log.info("\n".join(lines))
 
         return True
 
     except Exception as e:
-        print(f"✗ Verification failed: {e}")
+        log.error("✗ Verification failed: %s", e)
         return False
 
 
@@ -1107,32 +1540,116 @@ def verify_collections(client):
 # Main
 # ══════════════════════════════════════════════════════════════
 
+# Collection families. They share no references, so --parallel can populate
+# each one in its own process.
+LEGACY_PHASES = ("jeopardy", "books", "github")
+RAG_PHASES = ("rag-books", "rag-podcasts")
+
+SUCCESS_BANNER = f"""
+🎉 SUCCESS!
+{"=" * 60}
+Your Weaviate instance now contains comprehensive test data.
+
+🔗 Connect from Weaviate Studio:
+   Endpoint : http://localhost:8080
+   API Key  : test-key-123
+
+🧪 Test features:
+  Legacy – Nested Properties & Cross-References:
+     Author.address, Book.metadata, GitHubUser.stats
+     Book → Author, GitHubRepo → GitHubUser, Review → Book
+  RAG – Generative Search (requires OPENAI_API_KEY in .env):
+     "Find highly rated fantasy books"
+     "What topics do these podcasts cover?"
+     "Which books and podcasts are related to psychology?\""""
+
+
+def apply_options(args):
+    """Apply command-line switches that are stored as module settings."""
+    global VECTORIZE, REFRESH_CACHE, KEEP_EXISTING
+    if args.no_embed:
+        VECTORIZE = False
+    if args.keep_existing:
+        KEEP_EXISTING = True
+    if args.refresh_cache:
+        REFRESH_CACHE = True
+    if args.quiet:
+        log.setLevel(logging.WARNING)
+
+
+def populate_phase(client, phase: str, args) -> bool:
+    """Create and populate one collection family."""
+    if phase == "jeopardy":
+        return create_jeopardy_collection(client)
+    if phase == "books":
+        return create_book_collections(client)
+    if phase == "github":
+        return create_github_collections(client, args.skip_github)
+    # RAG imports report a row count; an empty download is not a failure.
+    if phase == "rag-books":
+        create_rag_books_collection(client)
+    else:
+        create_rag_podcast_collection(client)
+    return True
+
+
+def close_http_sessions() -> None:
+    """Close the dataset and GitHub HTTP sessions and their pooled connections."""
+    SESSION.close()
+    GITHUB_SESSION.close()
+
+
+def run_phase(phase: str, args) -> bool:
+    """Worker entry point for --parallel: populate *phase* with a dedicated client."""
+    apply_options(args)
+    client = connect_to_weaviate()
+    if not client:
+        close_http_sessions()
+        return False
+    try:
+        return populate_phase(client, phase, args)
+    finally:
+        client.close()
+        close_http_sessions()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Populate Weaviate with comprehensive test data')
     parser.add_argument('--skip-github', action='store_true', help='Skip GitHub data fetching')
     parser.add_argument('--verify-only', action='store_true', help='Only verify existing collections')
-    parser.add_argument('--rag-only', action='store_true', help='Only create RAG collections (Books, PodcastSearch)')
-    parser.add_argument('--legacy-only', action='store_true', help='Only create legacy collections')
+    only = parser.add_mutually_exclusive_group()
+    only.add_argument('--rag-only', action='store_true', help='Only create RAG collections (Books, PodcastSearch)')
+    only.add_argument('--legacy-only', action='store_true', help='Only create legacy collections')
+    parser.add_argument('--no-embed', action='store_true', help='Create collections without a vectorizer (faster import, no vector search)')
+    parser.add_argument('--refresh-cache', action='store_true', help=f'Re-download datasets cached in {CACHE_DIR}')
+    parser.add_argument('--parallel', action='store_true', help='Populate each collection family in its own worker process')
+    parser.add_argument('--quiet', action='store_true', help='Only print warnings and errors')
+    parser.add_argument('--keep-existing', action='store_true', help='Reuse existing collections instead of recreating them (re-imported objects are upserted by UUID, GitHub users already present are skipped; schemas are not changed)')
     args = parser.parse_args()
+    apply_options(args)
 
-    print("🚀 Weaviate Studio Sandbox – Test Data Population")
-    print("=" * 60)
+    log.info("🚀 Weaviate Studio Sandbox – Test Data Population")
+    log.info("=" * 60)
 
     if args.verify_only:
-        print("Running in verification-only mode...")
+        log.info("Running in verification-only mode...")
     else:
-        print("Embeddings : local text2vec-transformers (free)")
-        print("Generative : OpenAI (requires OPENAI_API_KEY at query time)")
-        print()
+        if VECTORIZE:
+            log.info("Embeddings : local text2vec-transformers (free)")
+        else:
+            log.info("Embeddings : disabled (--no-embed)")
+        log.info("Generative : OpenAI (requires OPENAI_API_KEY at query time)")
+        log.info("")
         if args.rag_only:
-            print("Mode: RAG collections only (Books, PodcastSearch)")
+            log.info("Mode: RAG collections only (Books, PodcastSearch)")
         elif args.legacy_only:
-            print("Mode: Legacy collections only (Jeopardy, Author, Book, etc.)")
+            log.info("Mode: Legacy collections only (Jeopardy, Author, Book, etc.)")
         else:
-            print("Mode: All collections (legacy + RAG)")
+            log.info("Mode: All collections (legacy + RAG)")
 
     client = connect_to_weaviate()
     if not client:
+        close_http_sessions()
         return 1
 
     try:
@@ -1140,48 +1657,46 @@ def main():
             if not verify_collections(client):
                 return 1
         else:
-            success = True
-
-            # Legacy collections
-            if not args.rag_only:
-                if not create_jeopardy_collection(client):
-                    success = False
-                if not create_book_collections(client):
-                    success = False
-                if not create_github_collections(client, args.skip_github):
-                    success = False
-
-            # RAG collections
-            if not args.legacy_only:
-                books_count = create_rag_books_collection(client)
-                podcasts_count = create_rag_podcast_collection(client)
+            legacy_phases = () if args.rag_only else LEGACY_PHASES
+            rag_phases = () if args.legacy_only else RAG_PHASES
+
+            if args.parallel:
+                # Spawned (not forked) workers, each with its own client –
+                # gRPC channels must not be shared across a fork.
+                phases = legacy_phases + rag_phases
+                with ProcessPoolExecutor(
+                    max_workers=len(phases),
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as pool:
+                    success = all(list(pool.map(run_phase, phases, repeat(args))))
+            else:
+                # One phase at a time keeps each phase's log output together.
+                results = [
+                    populate_phase(client, phase, args)
+                    for phase in legacy_phases + rag_phases
+                ]
+                success = all(results)
 
             if not success:
-                print("\n❌ Some collections failed to create. Check errors above.")
+                log.error("\n❌ Some collections failed to create. Check errors above.")
                 return 1
 
             # Verify everything
             verify_collections(client)
 
-        print("\n🎉 SUCCESS!")
-        print("=" * 60)
-        print("Your Weaviate instance now contains comprehensive test data.")
-        print("\n🔗 Connect from Weaviate Studio:")
-        print("   Endpoint : http://localhost:8080")
-        print("   API Key  : test-key-123")
-        print("\n🧪 Test features:")
-        print("  Legacy – Nested Properties & Cross-References:")
-        print("     Author.address, Book.metadata, GitHubUser.stats")
-        print("     Book → Author, GitHubRepo → GitHubUser, Review → Book")
-        print("  RAG – Generative Search (requires OPENAI_API_KEY in .env):")
-        print('     "Find highly rated fantasy books"')
-        print('     "What topics do these podcasts cover?"')
-        print('     "Which books and podcasts are related to psychology?"')
+        log.info(SUCCESS_BANNER)
 
         return 0
 
+    except SchemaError as e:
+        # Stop before any further family starts importing into a broken schema.
+        log.error("✗ %s", e)
+        log.error("\n❌ Aborting: fix the schema error above and re-run.")
+        return 1
+
     finally:
         client.close()
+        close_http_sessions()
 
 
 if __name__ == "__main__":
@@ -32,8 +32,10 @@ Requires the sandbox Weaviate running (see docker-compose.yml in this folder):
 
 import argparse
 import os
+import socket
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import weaviate
 import weaviate.classes as wvc
@@ -52,10 +54,32 @@ WEAVIATE_API_KEY = os.environ.get("WEAVIATE_API_KEY", "")
 
 TENANT_CHUNK = 100   # tenants created per API call
 INSERT_CHUNK = 200   # objects inserted per insert_many call
+VERIFY_WORKERS = 8   # concurrent per-tenant count queries in verify()
+READY_TIMEOUT = 30   # seconds to wait for the port and readiness, in total
+
+
+def wait_for_port(host, port, timeout):
+    """Return True once a TCP connection to host:port succeeds, False after `timeout` s."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return True
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
 
 
 def connect_to_weaviate():
     """Connect to the local sandbox Weaviate, waiting for readiness."""
+    # One deadline covers both the port wait and the readiness probe.
+    deadline = time.monotonic() + READY_TIMEOUT
+    # Cheap TCP probe first: no HTTP is spoken until the listener is bound.
+    if not wait_for_port(WEAVIATE_HOST, WEAVIATE_PORT, timeout=deadline - time.monotonic()):
+        print(f"✗ Nothing listening on {WEAVIATE_HOST}:{WEAVIATE_PORT} — is `docker compose up -d` running?")
+        return None
+
     client = weaviate.connect_to_local(
         host=WEAVIATE_HOST,
         port=WEAVIATE_PORT,
@@ -67,17 +91,20 @@ def connect_to_weaviate():
             timeout=weaviate.config.Timeout(init=30, query=60, insert=180)
         ),
     )
-    for attempt in range(10):
-        try:
-            client.collections.list_all()
-            print("✓ Connected to Weaviate")
-            return client
-        except Exception:
-            print(f"  waiting for Weaviate… ({attempt + 1}/10)")
-            time.sleep(2)
-    print("✗ Weaviate not ready — is `docker compose up -d` running?")
-    client.close()
-    return None
+    # is_ready() hits /v1/.well-known/ready, which stays cheap however many
+    # collections exist; back off from 100 ms up to 2 s between probes.
+    delay = 0.1
+    while not client.is_ready():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print("✗ Weaviate not ready — is `docker compose up -d` running?")
+            client.close()
+            return None
+        print(f"  waiting for Weaviate… ({remaining:.0f}s left)")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.6, 2.0)
+    print("✓ Connected to Weaviate")
+    return client
 
 
 def create_collection(client, name):
@@ -158,16 +185,17 @@ def populate_tenants(collection, tenant_names, fill_ratio, objects_per_tenant):
 def verify(collection, name):
     """Report tenant count and how many tenants are empty."""
     tenants = collection.tenants.get()
-    empty = 0
-    filled = 0
-    for tenant_name in tenants:
-        count = collection.with_tenant(tenant_name).aggregate.over_all(
+
+    def tenant_count(tenant_name):
+        return collection.with_tenant(tenant_name).aggregate.over_all(
             total_count=True
         ).total_count
-        if count == 0:
-            empty += 1
-        else:
-            filled += 1
+
+    # One count query per tenant; run them side by side on the shared client.
+    with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as pool:
+        counts = list(pool.map(tenant_count, tenants))
+    empty = counts.count(0)
+    filled = len(counts) - empty
     print(f"\nCollection '{name}':")
     print(f"  tenants total : {len(tenants)}")
     print(f"  with objects  : {filled}")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for the populate.py helpers that do not need a running Weaviate.
+
+Usage:
+    python3 -m unittest test_populate
+"""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+try:
+    import populate
+except ImportError:  # weaviate-client / requests not installed
+    populate = None
+
+
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    """Answer every GET with 429 Too Many Requests and a 1 s Retry-After."""
+
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        self.send_response(429)
+        self.send_header("Retry-After", "1")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeResponse:
+    """The parts of requests.Response that the GitHub helpers read."""
+
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+@unittest.skipIf(populate is None, "populate.py dependencies are not installed")
+class GitHubRateLimitTest(unittest.TestCase):
+    def setUp(self):
+        RateLimitedHandler.hits = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RateLimitedHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        populate.github_failures = 0
+        self.addCleanup(setattr, populate, "github_failures", 0)
+
+    def test_rate_limit_is_retried_by_github_get_only(self):
+        url = f"http://127.0.0.1:{self.server.server_port}"
+        with mock.patch.object(populate, "GITHUB_API_URL", url), \
+                mock.patch("time.sleep") as sleep:
+            response = populate.github_get("/users/octocat", populate.GITHUB_HEADERS)
+
+        self.assertEqual(response.status_code, 429)
+        # One request per github_get attempt – the transport adds no retries.
+        self.assertEqual(RateLimitedHandler.hits, populate.GITHUB_MAX_ATTEMPTS)
+        delays = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(delays, [1.0] * (populate.GITHUB_MAX_ATTEMPTS - 1))
+
+
+@unittest.skipIf(populate is None, "populate.py dependencies are not installed")
+class GitHubCircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        populate.github_failures = 0
+        self.addCleanup(setattr, populate, "github_failures", 0)
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        threshold = populate.GITHUB_CIRCUIT_BREAKER_THRESHOLD
+        with mock.patch.object(populate.GITHUB_SESSION, "get",
+                               return_value=FakeResponse(500)) as get:
+            for _ in range(threshold):
+                self.assertEqual(populate.github_get("/users/octocat", {}).status_code, 500)
+            self.assertIsNone(populate.github_get("/users/octocat", {}))
+        self.assertEqual(get.call_count, threshold)
+
+    def test_success_resets_the_failure_count(self):
+        populate.github_failures = populate.GITHUB_CIRCUIT_BREAKER_THRESHOLD - 1
+        with mock.patch.object(populate.GITHUB_SESSION, "get",
+                               return_value=FakeResponse(200, b"{}")):
+            populate.github_get("/users/octocat", {})
+        self.assertEqual(populate.github_failures, 0)
+
+
+@unittest.skipIf(populate is None, "populate.py dependencies are not installed")
+class GitHubCacheTest(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        for name, value in (("GITHUB_CACHE_DIR", Path(cache_dir.name)),
+                            ("REFRESH_CACHE", False),
+                            ("github_failures", 0)):
+            patcher = mock.patch.object(populate, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def fetch(self, *responses):
+        with mock.patch.object(populate.GITHUB_SESSION, "get", side_effect=responses) as get:
+            return populate.fetch_github_json("/users/octocat"), get
+
+    def test_fresh_entry_is_served_without_a_request(self):
+        data, get = self.fetch(FakeResponse(200, b'{"login": "octocat"}', {"ETag": '"v1"'}))
+        self.assertEqual(data, {"login": "octocat"})
+        self.assertEqual(get.call_count, 1)
+
+        data, get = self.fetch()
+        self.assertEqual(data, {"login": "octocat"})
+        get.assert_not_called()
+
+    def test_stale_entry_is_revalidated_with_its_etag(self):
+        self.fetch(FakeResponse(200, b'{"login": "octocat"}', {"ETag": '"v1"'}))
+        with mock.patch.object(populate, "GITHUB_CACHE_TTL", 0):
+            data, get = self.fetch(FakeResponse(304))
+        self.assertEqual(data, {"login": "octocat"})
+        self.assertEqual(get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+
+    def test_stale_entry_is_used_when_github_fails(self):
+        self.fetch(FakeResponse(200, b'{"login": "octocat"}', {"ETag": '"v1"'}))
+        with mock.patch.object(populate, "GITHUB_CACHE_TTL", 0):
+            data, _ = self.fetch(FakeResponse(502))
+        self.assertEqual(data, {"login": "octocat"})
+
+
+@unittest.skipIf(populate is None, "populate.py dependencies are not installed")
+class RowMapperTest(unittest.TestCase):
+    def test_defaults_replace_only_missing_and_null_values(self):
+        mapper = populate.row_mapper((
+            ("count", "count", 7),
+            ("flag", "flag", True),
+            ("label", "label", "none"),
+            ("missing", "missing", "default"),
+        ))
+        row = {"count": 0, "flag": False, "label": None}
+        self.assertEqual(
+            mapper(row),
+            {"count": 0, "flag": False, "label": "none", "missing": "default"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()